@@ -2,8 +2,11 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
+import matplotlib.pyplot as plt
 from depender.graph.dependency import DependencyGraph
 from depender.graph.structure import StructureGraph
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 
 class BaseBackend(ABC):
@@ -19,6 +22,21 @@ class BaseBackend(ABC):
         self.figure_dimensions = figure_dimensions
         self.dpi = dpi
 
+    def get_figure(self) -> Tuple[Figure, Axes]:
+        r"""Create a figure with the backend's dimensions and resolution
+
+        Returns:
+            The created figure and its axes
+        """
+        fig, ax = plt.subplots(
+            figsize=(
+                self.figure_dimensions[0] / self.dpi,
+                self.figure_dimensions[1] / self.dpi,
+            ),
+            dpi=self.dpi,
+        )
+        return fig, ax
+
     @abstractmethod
     def plot(self, *args, **kwargs):
         raise NotImplementedError
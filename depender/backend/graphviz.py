@@ -3,7 +3,9 @@ from io import BytesIO
 import graphviz
 import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
+import numpy as np
 from depender.backend.base import BaseBackend
+from depender.backend.utilities import get_colormap
 from depender.graph import DependencyGraph, StructureGraph
 from matplotlib.colors import to_hex
 
@@ -12,17 +14,9 @@ class GraphivizBackend(BaseBackend):
     def plot(self, *args, **kwargs):
         dot = args[0]
         dot_str = graphviz.pipe(engine="dot", format="png", data=dot.source.encode())
-        # treat the dot output string as an image file
-        sio = BytesIO()
-        sio.write(dot_str)
-        sio.seek(0)
-        fig, ax = plt.subplots(
-            figsize=(
-                self.figure_dimensions[0] / self.dpi,
-                self.figure_dimensions[1] / self.dpi,
-            ),
-            dpi=self.dpi,
-        )
+        # treat the dot output string as an image file, wrapping it without a copy
+        sio = BytesIO(dot_str)
+        fig, ax = self.get_figure()
         ax.axis("off")
         img = mpimg.imread(sio)
         # plot the image
@@ -49,19 +43,22 @@ class GraphivizBackend(BaseBackend):
             self.save_to_file(dot, filename="dependency_matrix")
 
     def plot_dependency_graph(self, graph: DependencyGraph, **kwargs):
-        graph.layout(graph=True)
+        # The graph is not laid out beforehand since dot computes its own layout
         dot = graphviz.Digraph(name="Dependency Graph")
         dot.graph_attr["dpi"] = str(self.dpi)
-        degrees = {
-            node: graph.out_degree(node) - graph.in_degree(node) for node in graph.nodes
-        }
+        # Attributes shared by all nodes are set once for the whole graph
+        dot.node_attr["style"] = "filled"
+        in_degrees, out_degrees = graph.compute_degrees()
+        degrees = {node: out_degrees[node] - in_degrees[node] for node in graph.nodes}
         min_degree, max_degree = min(degrees.values()), max(degrees.values())
-        cmap = plt.get_cmap("coolwarm")
+        # Avoid dividing by zero when all nodes have the same degree
+        degree_range = max(max_degree - min_degree, 1)
+        cmap = get_colormap("coolwarm")
         for node, degree in degrees.items():
-            color = cmap((degree - min_degree) * cmap.N // (max_degree - min_degree))
+            color = cmap((degree - min_degree) * cmap.N // degree_range)
             color = (*color[:3], 0.7)
             color = to_hex(color, keep_alpha=True)
-            dot.node(node, fillcolor=color, style="filled")
+            dot.node(node, fillcolor=color)
         for edge in graph.edges:
             dot.edge(*edge)
         if self.format is None:
@@ -73,22 +70,20 @@ class GraphivizBackend(BaseBackend):
         dot = graphviz.Digraph(name="Structure Graph")
         dot.graph_attr["fixedsize"] = "true"
         dot.graph_attr["splines"] = "true"
-        cmap = plt.get_cmap("coolwarm")
+        dot.node_attr["style"] = "filled"
+        cmap = get_colormap("coolwarm")
+        # Colors and shapes only depend on the node type so they are computed once
+        node_styles = {
+            node_type: (to_hex((*cmap(value)[:3], 0.7), keep_alpha=True), shape)
+            for node_type, value, shape in [
+                ("root", 0.2, "folder"),
+                ("directory", 0.5, "folder"),
+                ("file", 0.8, "note"),
+            ]
+        }
         for node, attrs in graph.nodes.items():
-            if attrs["type"] == "root":
-                color = cmap(0.2)
-                shape = "folder"
-            elif attrs["type"] == "directory":
-                color = cmap(0.5)
-                shape = "folder"
-            else:
-                color = cmap(0.8)
-                shape = "note"
-            color = (*color[:3], 0.7)
-            color = to_hex(color, keep_alpha=True)
-            dot.node(
-                node, label=attrs["label"], shape=shape, fillcolor=color, style="filled"
-            )
+            color, shape = node_styles.get(attrs["type"], node_styles["file"])
+            dot.node(node, label=attrs["label"], shape=shape, fillcolor=color)
         for edge in graph.edges:
             dot.edge(*edge)
         if self.format is None:
@@ -99,30 +94,30 @@ class GraphivizBackend(BaseBackend):
     def _create_dependency_table(self, graph):
         node_names = list(graph.nodes)
         node_count = graph.number_of_nodes()
-        matrix = [[0 for _ in range(node_count)] for _ in range(node_count)]
-        max_count = 0
+        node_indices = {node: index for index, node in enumerate(node_names)}
+        matrix = np.zeros((node_count, node_count), dtype=int)
         for (source, sink, values) in graph.edges.data():
-            matrix[graph.nodes[source]["index"]][graph.nodes[sink]["index"]] = values[
-                "count"
-            ]
-            max_count = max(max_count, values["count"])
-        max_count = max(max_count, 1)
+            matrix[node_indices[source], node_indices[sink]] = values["count"]
+        max_count = max(matrix.max(initial=0), 1)
         table = list()
         table.append("<<table>")
-        header_str = "<tr><td></td>"
-        for name in node_names:
-            header_str += "<td>{}</td>".format(name)
-        header_str += "</tr>"
-        table.append(header_str)
-        cmap = plt.get_cmap("coolwarm")
-        for i, row in enumerate(matrix):
-            row_str = "<tr><td>{}</td>".format(node_names[i])
-            for count in row:
-                color = cmap(count * cmap.N // max_count)
-                color = (*color[:3], 0.7)
-                color = to_hex(color, keep_alpha=True)
-                row_str += "<td bgcolor='{}'>{}</td>".format(color, count)
-            row_str += "</tr>\n"
-            table.append(row_str)
+        header_cells = "".join("<td>{}</td>".format(name) for name in node_names)
+        table.append("<tr><td></td>{}</tr>".format(header_cells))
+        cmap = get_colormap("coolwarm")
+        # Compute the colors of all distinct counts at once instead of once per cell
+        counts = np.unique(matrix)
+        count_colors = {
+            count: to_hex(color, keep_alpha=True)
+            for count, color in zip(
+                counts, cmap(counts * cmap.N // max_count, alpha=0.7)
+            )
+        }
+        # Join the cells of each row once instead of growing the row string cell by cell
+        for name, row in zip(node_names, matrix):
+            row_cells = "".join(
+                "<td bgcolor='{}'>{}</td>".format(count_colors[count], count)
+                for count in row
+            )
+            table.append("<tr><td>{}</td>{}</tr>\n".format(name, row_cells))
         table.append("</table>>")
         return "\n".join(table)
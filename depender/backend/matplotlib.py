@@ -1,8 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from depender.backend.base import BaseBackend
+from depender.backend.utilities import get_colormap
 from depender.graph import DependencyGraph, StructureGraph
-from matplotlib import cm
 from matplotlib.collections import LineCollection
 from matplotlib.patches import FancyArrowPatch
 
@@ -18,27 +18,23 @@ class MatplotlibBackend(BaseBackend):
         filename = kwargs.pop("filename", "graph")
         fig.tight_layout()
         output_file = (self.output_dir / filename).with_suffix(self.format)
-        fig.savefig(output_file)
+        # Write the rendered figure through a large buffer, then release the figure
+        # since it is not needed anymore once saved
+        with output_file.open("wb", buffering=1 << 20) as f:
+            fig.savefig(f, format=output_file.suffix[1:])
+        plt.close(fig)
 
     def plot_dependency_matrix(self, graph: DependencyGraph, **kwargs):
         graph.layout(matrix=True)
         node_names = graph.nodes()
         node_count = graph.number_of_nodes()
 
-        matrix = [[0 for _ in range(node_count)] for _ in range(node_count)]
+        node_indices = {node: index for index, node in enumerate(node_names)}
+        matrix = np.zeros((node_count, node_count), dtype=int)
         for (source, sink, values) in graph.edges.data():
-            matrix[graph.nodes[source]["index"]][graph.nodes[sink]["index"]] = values[
-                "count"
-            ]
-            # matrix[graph.get_node(sink).index, graph.get_node(source).index] -= 1
-        cmap = plt.get_cmap("coolwarm")
-        fig, ax = plt.subplots(
-            figsize=(
-                self.figure_dimensions[0] / self.dpi,
-                self.figure_dimensions[1] / self.dpi,
-            ),
-            dpi=self.dpi,
-        )
+            matrix[node_indices[source], node_indices[sink]] = values["count"]
+        cmap = get_colormap("coolwarm")
+        fig, ax = self.get_figure()
         ax.matshow(matrix, cmap=cmap, aspect="equal", origin="upper", alpha=0.7)
         # Major ticks
         major_tick_locations = np.arange(node_count)
@@ -70,14 +66,12 @@ class MatplotlibBackend(BaseBackend):
 
     def plot_dependency_graph(self, graph: DependencyGraph, **kwargs):
         graph.layout(graph=True)
-        fig, ax = plt.subplots(
-            figsize=(
-                self.figure_dimensions[0] / self.dpi,
-                self.figure_dimensions[1] / self.dpi,
-            ),
-            dpi=self.dpi,
-        )
+        fig, ax = self.get_figure()
         ax.axis("off")
+        # Draw the nodes (z-order 2) and edges (z-order 1) as a single image instead of
+        # one vector path each when saving to svg or pdf. The axis, spines and ticks
+        # are the only other artists below this z-order and they are hidden.
+        ax.set_rasterization_zorder(3)
         self._plot_dependency_nodes(graph)
         self._plot_dependency_edges(graph)
         if self.format is None:
@@ -86,13 +80,7 @@ class MatplotlibBackend(BaseBackend):
             self.save_to_file(fig, filename="dependency_graph")
 
     def plot_structure_graph(self, graph: StructureGraph, **kwargs):
-        fig, ax = plt.subplots(
-            figsize=(
-                self.figure_dimensions[0] / self.dpi,
-                self.figure_dimensions[1] / self.dpi,
-            ),
-            dpi=self.dpi,
-        )
+        fig, ax = self.get_figure()
         ax.axis("off")
         self._plot_structure_nodes(graph)
         self._plot_structure_edges(graph)
@@ -105,25 +93,31 @@ class MatplotlibBackend(BaseBackend):
     def _plot_dependency_nodes(graph: DependencyGraph, ax=None):
         if ax is None:
             ax = plt.gca()
-        node_x, node_y = [], []
-        for node, value in graph.nodes.items():
-            node_x.append(value["position"][0])
-            node_y.append(value["position"][1])
-        node_sizes = list()
-        node_colors = list()
+        node_count = graph.number_of_nodes()
+        # Gather all the positions computed by the layout into a single array
+        positions = np.array(
+            [node_attr["position"] for node_attr in graph.nodes.values()], dtype=float
+        ).reshape(node_count, 2)
+        node_sizes = np.empty(node_count)
+        node_colors = np.empty(node_count)
         base_size = 40
 
-        for node in graph.nodes:
-            degree = graph.out_degree(node) - graph.in_degree(node)
+        in_degrees, out_degrees = graph.compute_degrees()
+        for i, (node, node_attr) in enumerate(graph.nodes.items()):
+            degree = out_degrees[node] - in_degrees[node]
             size_multiplier = abs(degree)
-            node_colors.append(degree)
-            node_size = base_size * (1 + size_multiplier)
-            node_sizes.append(node_size)
-            graph.nodes[node]["size"] = node_size
+            node_colors[i] = degree
+            node_sizes[i] = base_size * (1 + size_multiplier)
+            node_attr["size"] = node_sizes[i]
 
-        cmap = plt.get_cmap("coolwarm")
+        cmap = get_colormap("coolwarm")
         node_scatter = ax.scatter(
-            node_x, node_y, s=node_sizes, c=node_colors, cmap=cmap, alpha=0.7
+            positions[:, 0],
+            positions[:, 1],
+            s=node_sizes,
+            c=node_colors,
+            cmap=cmap,
+            alpha=0.7,
         )
         node_scatter.set_zorder(2)
 
@@ -131,20 +125,13 @@ class MatplotlibBackend(BaseBackend):
     def _plot_dependency_edges(graph: DependencyGraph, ax=None):
         if ax is None:
             ax = plt.gca()
-        edge_positions = []
-        for (source, sink, _) in graph.edges.data():
-            edge_positions.append(
-                (graph.nodes[source]["position"], graph.nodes[sink]["position"])
-            )
-        edge_positions = np.asarray(edge_positions)
-        edge_collection = list()
-        for (source_name, sink_name), (source, sink) in zip(
-            graph.edges(), edge_positions
-        ):
-            x1, y1 = source
-            x2, y2 = sink
-            edge_start_offset = np.sqrt(graph.nodes[source_name]["size"]) / 2
-            edge_end_offset = np.sqrt(graph.nodes[sink_name]["size"]) / 2
+        nodes = graph.nodes
+        for source, sink in graph.edges():
+            source_attr, sink_attr = nodes[source], nodes[sink]
+            x1, y1 = source_attr["position"]
+            x2, y2 = sink_attr["position"]
+            edge_start_offset = np.sqrt(source_attr["size"]) / 2
+            edge_end_offset = np.sqrt(sink_attr["size"]) / 2
             arrow = FancyArrowPatch(
                 (x1, y1),
                 (x2, y2),
@@ -155,7 +142,6 @@ class MatplotlibBackend(BaseBackend):
                 alpha=0.7,
                 zorder=1,
             )
-            edge_collection.append(arrow)
             ax.add_patch(arrow)
 
     @staticmethod
@@ -165,15 +151,12 @@ class MatplotlibBackend(BaseBackend):
         fig = plt.gcf()
         text_boxes = list()
         display_to_data = ax.transData.inverted()
-        cmap = cm.get_cmap("summer")
+        cmap = get_colormap("summer")
+        node_colors = {"root": cmap(0.2), "directory": cmap(0.5)}
+        file_color = cmap(0.8)
         base_font_size: float = 4
         for node_attr in graph.nodes.values():
-            if node_attr["type"] == "root":
-                color = cmap(0.2)
-            elif node_attr["type"] == "directory":
-                color = cmap(0.5)
-            else:
-                color = cmap(0.8)
+            color = node_colors.get(node_attr["type"], file_color)
             text_box = ax.text(
                 node_attr["x"],
                 node_attr["y"],
@@ -196,16 +179,21 @@ class MatplotlibBackend(BaseBackend):
             node_attr["height"] = height
         # Layout the graph after setting nodes' width and height
         graph.layout()
-        x, y = zip(
-            *[(node_attr["x"], node_attr["y"]) for node_attr in graph.nodes.values()]
+        # Normalize all the positions at once
+        positions = np.array(
+            [(node_attr["x"], node_attr["y"]) for node_attr in graph.nodes.values()],
+            dtype=float,
         )
-        min_x, max_x = min(x), max(x)
-        min_y = min(y)
-        for node_attr in graph.nodes.values():
-            node_attr["x"] = (node_attr["x"] - min_x) / (max_x - min_x)
-            node_attr["y"] = -node_attr["y"] / min_y + 1
-        for text_box, node_attr in zip(text_boxes, graph.nodes.values()):
-            text_box.set_position((node_attr["x"], node_attr["y"]))
+        x, y = positions[:, 0], positions[:, 1]
+        min_x, max_x = x.min(), x.max()
+        min_y = y.min()
+        x[:] = (x - min_x) / (max_x - min_x)
+        y[:] = -y / min_y + 1
+        for text_box, node_attr, position in zip(
+            text_boxes, graph.nodes.values(), positions
+        ):
+            node_attr["x"], node_attr["y"] = position
+            text_box.set_position(position)
         ax.set_xlim((0.0, 1.0))
         ax.set_ylim((-0.1, 1.1))
 
@@ -213,28 +201,21 @@ class MatplotlibBackend(BaseBackend):
     def _plot_structure_edges(graph: StructureGraph, ax=None) -> None:
         if ax is None:
             ax = plt.gca()
-        cmap = cm.get_cmap("summer")
+        cmap = get_colormap("summer")
+        nodes = graph.nodes
         edge_positions = list()
         for source, sink in graph.edges():
-            start = (
-                graph.nodes[source]["x"],
-                graph.nodes[source]["y"] - graph.nodes[source]["height"] / 2,
-            )
-            end = (
-                graph.nodes[source]["x"],
-                (graph.nodes[source]["y"] + graph.nodes[sink]["y"]) / 2,
-            )
-            edge_positions += [(start, end)]
+            source_attr, sink_attr = nodes[source], nodes[sink]
+            start = (source_attr["x"], source_attr["y"] - source_attr["height"] / 2)
+            end = (source_attr["x"], (source_attr["y"] + sink_attr["y"]) / 2)
+            edge_positions.append((start, end))
             start = end
-            if graph.nodes[source]["x"] != graph.nodes[sink]["x"]:
-                end = (graph.nodes[sink]["x"], end[1])
-                edge_positions += [(start, end)]
+            if source_attr["x"] != sink_attr["x"]:
+                end = (sink_attr["x"], end[1])
+                edge_positions.append((start, end))
                 start = end
-            end = (
-                graph.nodes[sink]["x"],
-                graph.nodes[sink]["y"] + graph.nodes[sink]["height"] / 2,
-            )
-            edge_positions += [(start, end)]
+            end = (sink_attr["x"], sink_attr["y"] + sink_attr["height"] / 2)
+            edge_positions.append((start, end))
 
         edge_positions = list(set(edge_positions))
         edge_positions = np.asarray(edge_positions)
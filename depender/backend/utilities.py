@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+import matplotlib.pyplot as plt
+from matplotlib.colors import Colormap
+
+
+@lru_cache(maxsize=None)
+def get_colormap(name: str) -> Colormap:
+    r"""Get the colormap registered under the given name.
+
+    The lookup is done only once per name and then shared by all backend instances.
+
+    Args:
+        name: Name of a registered matplotlib colormap
+
+    Returns:
+        The corresponding colormap
+    """
+    return plt.get_cmap(name)
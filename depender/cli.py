@@ -1,17 +1,42 @@
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib.util import find_spec
 from pathlib import Path
-from typing import List
+from stat import S_ISDIR, S_ISREG
+from typing import List, Optional, Union
 
 import click
 from click_spinner import spinner  # type: ignore
 from depender.backend import get_backend
+from depender.graph import DependencyGraph, StructureGraph
+from depender.parse.cache import ParseCache
 from depender.parse.code import CodeParser
 from depender.parse.structure import StructureParser
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"], ignore_unknown_options=True)
 
 
+def parse_project(
+    parser: Union[CodeParser, StructureParser], cache: Optional[ParseCache], **kwargs
+) -> Union[DependencyGraph, StructureGraph]:
+    """Parse the project with the given parser, unless its graph is already cached"""
+    if cache is None:
+        return parser.parse_project(**kwargs)
+    key = cache.compute_key(
+        files=parser.find_project_files(**kwargs),
+        # The structure graph only depends on the names of the files
+        hash_contents=isinstance(parser, CodeParser),
+        parser=type(parser).__name__,
+        **kwargs,
+    )
+    graph = cache.load(key)
+    if graph is None:
+        graph = parser.parse_project(**kwargs)
+        cache.save(key, graph)
+    return graph
+
+
 @click.command(context_settings=CONTEXT_SETTINGS)
 @click.argument("path-or-name", nargs=1)
 @click.argument(
@@ -74,6 +99,21 @@ CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"], ignore_unknown_optio
     show_default=True,
     help="Depth of the directory recursion",
 )
+@click.option(
+    "--no-cache",
+    type=click.BOOL,
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="When set, the package is parsed again instead of reusing cached results",
+)
+@click.option(
+    "--only",
+    type=click.Choice(["dependency", "structure", "all"]),
+    default="all",
+    show_default=True,
+    help="Only parse and plot the dependency graph and matrix, or the structure graph",
+)
 @click.version_option()
 def main(
     path_or_name: str,
@@ -85,6 +125,8 @@ def main(
     include_external: bool,
     no_follow_links: bool,
     depth: int,
+    no_cache: bool,
+    only: str,
 ) -> None:
     r"""Depender command line interface
 
@@ -97,19 +139,33 @@ def main(
     EXCLUDED_DIRS should be, if provided, the paths relative to the package of one or more directories
     to exclude from the graph.
     """
-    try:
-        spec = find_spec(path_or_name)
-    except ModuleNotFoundError:
-        spec = None
     # Try to find the package path
     package_path = Path(path_or_name)
-    if package_path.is_file() and package_path.suffix == ".py":
+    try:
+        path_mode = package_path.stat().st_mode
+    except OSError:
+        path_mode = None
+    # Only look for an installed package or module if the argument is not a path
+    # since find_spec imports the parent packages of the given name
+    spec = None
+    if path_mode is None and not any(
+        separator in path_or_name for separator in (os.sep, os.altsep) if separator
+    ):
+        try:
+            spec = find_spec(path_or_name)
+        except (ImportError, ValueError):
+            spec = None
+    if path_mode is not None and S_ISREG(path_mode) and package_path.suffix == ".py":
         click.echo(f"Found module at '{package_path.absolute()}'")
         is_module = True
-    elif package_path.is_dir() and package_path.joinpath("__init__.py").is_file():
+    elif (
+        path_mode is not None
+        and S_ISDIR(path_mode)
+        and package_path.joinpath("__init__.py").is_file()
+    ):
         click.echo(f"Found package at '{package_path.absolute()}'")
         is_module = False
-    elif spec is not None:
+    elif spec is not None and spec.origin is not None:
         package_path = Path(spec.origin)
         if package_path.name == "__init__.py":
             click.echo(f"Found package '{path_or_name}'")
@@ -123,36 +179,55 @@ def main(
         sys.exit(1)
     # Get the desired image dimensions
     image_width, image_height = map(int, image_dimensions.split(","))
-    # Instantiate the parsers
+    # Instantiate the parsers and the cache of their results
     code_parser = CodeParser()
     structure_parser = StructureParser()
+    cache = None if no_cache else ParseCache()
     # Instantiate the backend
     backend = get_backend(backend)(
         output_dir=output_dir,
         format=format,
         figure_dimensions=(image_width, image_height),
     )
+    plot_dependencies = only in ("dependency", "all")
+    plot_structure = only in ("structure", "all")
     click.echo("Parsing package...")
     with spinner():
-        code_graph = code_parser.parse_project(
-            package_path=package_path,
-            is_module=is_module,
-            excluded_directories=excluded_dirs,
-            include_external=include_external,
-            follow_links=not no_follow_links,
-        )
-        structure_graph = structure_parser.parse_project(
-            package_path=package_path,
-            excluded_directories=excluded_dirs,
-            follow_links=not no_follow_links,
-            depth=depth,
-        )
+        # Both parsers mostly wait on the file system, so they can run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if plot_dependencies:
+                code_future = executor.submit(
+                    parse_project,
+                    code_parser,
+                    cache,
+                    package_path=package_path,
+                    is_module=is_module,
+                    excluded_directories=excluded_dirs,
+                    include_external=include_external,
+                    follow_links=not no_follow_links,
+                )
+            if plot_structure:
+                structure_future = executor.submit(
+                    parse_project,
+                    structure_parser,
+                    cache,
+                    package_path=package_path,
+                    excluded_directories=excluded_dirs,
+                    follow_links=not no_follow_links,
+                    depth=depth,
+                )
+            if plot_dependencies:
+                code_graph = code_future.result()
+            if plot_structure:
+                structure_graph = structure_future.result()
     # Layout and write to file
     click.echo("Plotting graphs...")
     with spinner():
-        backend.plot_dependency_matrix(code_graph)
-        backend.plot_dependency_graph(code_graph)
-        backend.plot_structure_graph(structure_graph)
+        if plot_dependencies:
+            backend.plot_dependency_matrix(code_graph)
+            backend.plot_dependency_graph(code_graph)
+        if plot_structure:
+            backend.plot_structure_graph(structure_graph)
     click.echo("Done")
 
 
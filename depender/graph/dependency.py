@@ -1,6 +1,14 @@
 import warnings
+from typing import Dict, Tuple
 
-from networkx import DiGraph, NetworkXException, planar_layout
+import numpy as np
+from networkx import (
+    DiGraph,
+    NetworkXException,
+    fruchterman_reingold_layout,
+    planar_layout,
+    rescale_layout,
+)
 
 __all__ = ["DependencyGraph"]
 
@@ -10,18 +18,52 @@ class DependencyGraph(DiGraph):
         matrix = kwargs.pop("matrix", False)
         graph = kwargs.pop("graph", False)
         if matrix:
-            for i, node in enumerate(self):
-                self.nodes[node]["index"] = i
-            for (source, sink, _) in self.edges.data():
-                if "count" not in self.edges[(source, sink)]:
-                    self.edges[(source, sink)]["count"] = 0
-                self.edges[(source, sink)]["count"] += 1
+            for (_, _, edge_attr) in self.edges.data():
+                # Edges counted by a previous call are marked and left untouched
+                # so that laying out the graph several times gives the same counts
+                if "count" not in edge_attr:
+                    edge_attr["count"] = 1
         if graph:
             try:
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore")
                     positions = planar_layout(self)
-                for node, pos in positions.items():
-                    self.nodes[node]["position"] = pos
             except NetworkXException:
-                pass
+                # The graph is not planar, fall back to a force-directed layout
+                positions = self._force_directed_layout()
+            for node, pos in positions.items():
+                self.nodes[node]["position"] = pos
+
+    def compute_degrees(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        r"""Compute the in-degree and out-degree of all nodes in a single pass
+
+        Returns:
+            Dictionaries mapping each node to its in-degree and to its out-degree
+        """
+        in_degrees = dict.fromkeys(self, 0)
+        out_degrees = dict(in_degrees)
+        for source, sinks in self.adjacency():
+            out_degrees[source] = len(sinks)
+            for sink in sinks:
+                in_degrees[sink] += 1
+        return in_degrees, out_degrees
+
+    def _force_directed_layout(self) -> Dict[str, np.ndarray]:
+        r"""Compute node positions using the Fruchterman-Reingold algorithm.
+
+        igraph's implementation is used when it is installed, otherwise networkx's.
+
+        Returns:
+            Dictionary mapping each node to its position
+        """
+        # igraph is imported here rather than with the module since it is slow to import
+        # and only needed for non planar graphs
+        try:
+            import igraph  # type: ignore
+        except ImportError:
+            return fruchterman_reingold_layout(self)
+        ig_graph = igraph.Graph.from_networkx(self)
+        coordinates = ig_graph.layout_fruchterman_reingold(niter=500).coords
+        positions = rescale_layout(np.asarray(coordinates, dtype=float))
+        # igraph keeps the node order of the networkx graph
+        return dict(zip(self.nodes, positions))
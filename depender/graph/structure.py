@@ -38,14 +38,18 @@ class StructureGraph(DiGraph):
         self.add_node(sink)
         super().add_edge(source, sink, **kwargs)
         # Add properties to both nodes
-        self.nodes[source]["children"] += [sink]
+        children = self.nodes[source]["children"]
+        children.append(sink)
         self.nodes[sink]["parent"] = source
         self.nodes[sink]["ancestor"] = sink
-        self.nodes[sink]["index"] = len(list(self.successors(source)))
+        # Use the size of the adjacency view instead of listing all the successors,
+        # which made adding the children of a node quadratic in their number
+        children_count = len(self.succ[source])
+        self.nodes[sink]["index"] = children_count
         # Add siblings
-        if len(list(self.successors(source))) > 1:
-            self.nodes[sink]["leftmost_sibling"] = next(iter(self.successors(source)))
-            self.nodes[sink]["left_sibling"] = list(self.successors(source))[-2]
+        if children_count > 1:
+            self.nodes[sink]["leftmost_sibling"] = children[0]
+            self.nodes[sink]["left_sibling"] = children[-2]
 
     @property
     def root_node(self) -> str:
@@ -0,0 +1,157 @@
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from networkx import DiGraph
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # pragma: no cover
+    # Python < 3.8
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
+    from pkg_resources import get_distribution
+
+    def version(distribution_name: str) -> str:
+        return get_distribution(distribution_name).version
+
+
+__all__ = ["ParseCache"]
+
+# Bump this whenever the parsers change the graphs they produce,
+# in addition to the installed version of depender that is also part of the keys
+CACHE_VERSION = 2
+
+# Name of the cache entry and digest of the files it was computed from
+CacheKey = Tuple[str, str]
+
+
+def get_default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+    return Path(cache_home) / "depender"
+
+
+def get_depender_version() -> str:
+    try:
+        return version("depender")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class ParseCache:
+    r"""Disk cache for the graphs created by the parsers.
+
+    The cache holds a single entry per parser, package path and parsing options,
+    which is overwritten whenever the package changes.
+    An entry is only used if it was computed from the same files, i.e. the same paths
+    of the files read by the parser and the same content of the python files among them.
+    File digests are stored along with each entry and with the file's modification time
+    and size, so that unchanged files are not read again on the next run.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        if cache_dir is None:
+            cache_dir = get_default_cache_dir()
+        self.cache_dir = Path(cache_dir)
+
+    def compute_key(
+        self,
+        package_path: Union[str, Path],
+        files: Iterable[Path],
+        hash_contents: bool = True,
+        **options,
+    ) -> CacheKey:
+        r"""Compute the cache key of a package parsed with the given options
+
+        Args:
+            package_path: Path to the package or module, exactly as given to the parser
+            files: Paths of the files read by the parser
+            hash_contents: Whether the content of the python files is part of the key
+            **options: Any other option that changes the parsed graph
+
+        Returns:
+            Name of the cache entry and digest of the files
+        """
+        entry_hasher = hashlib.sha1()
+        entry_hasher.update(str(CACHE_VERSION).encode())
+        entry_hasher.update(get_depender_version().encode())
+        # The parsers name modules and files after the path as given,
+        # which may be relative to the current working directory
+        entry_hasher.update(str(package_path).encode())
+        entry_hasher.update(os.path.abspath(str(package_path)).encode())
+        entry_hasher.update(repr(sorted(options.items())).encode())
+        entry = entry_hasher.hexdigest()
+
+        previous_digests = self._read(self._digests_file(entry))
+        if not isinstance(previous_digests, dict):
+            previous_digests = dict()
+        digests: Dict[str, Tuple[int, int, str]] = dict()
+        files_hasher = hashlib.sha1()
+        for path in sorted(files):
+            files_hasher.update(str(path).encode())
+            if hash_contents and path.suffix == ".py":
+                files_hasher.update(
+                    self._file_digest(path, previous_digests, digests).encode()
+                )
+        # Only the digests of the files read this time are kept
+        if digests != previous_digests:
+            self._dump(self._digests_file(entry), digests)
+        return entry, files_hasher.hexdigest()
+
+    def load(self, key: CacheKey) -> Optional[DiGraph]:
+        entry, files_digest = key
+        cached = self._read(self._graph_file(entry))
+        if not isinstance(cached, tuple) or cached[0] != files_digest:
+            return None
+        return cached[1]
+
+    def save(self, key: CacheKey, graph: DiGraph) -> None:
+        entry, files_digest = key
+        self._dump(self._graph_file(entry), (files_digest, graph))
+
+    def _graph_file(self, entry: str) -> Path:
+        return self.cache_dir / "{}.pkl".format(entry)
+
+    def _digests_file(self, entry: str) -> Path:
+        return self.cache_dir / "{}.digests.pkl".format(entry)
+
+    @staticmethod
+    def _file_digest(
+        path: Path,
+        previous_digests: Dict[str, Tuple[int, int, str]],
+        digests: Dict[str, Tuple[int, int, str]],
+    ) -> str:
+        absolute_path = os.path.abspath(str(path))
+        stat = path.stat()
+        cached = previous_digests.get(absolute_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            digest = cached[2]
+        else:
+            digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        digests[absolute_path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    @staticmethod
+    def _read(filepath: Path):
+        # The cache is only an optimization, a missing, corrupted or outdated file
+        # e.g. one referring to a renamed class, is treated as a cache miss
+        try:
+            with filepath.open("rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _dump(self, filepath: Path, obj) -> None:
+        # Failing to write to the cache is not an error either
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temporary_file = filepath.with_name(
+                "{}.{}.tmp".format(filepath.stem, threading.get_ident())
+            )
+            with temporary_file.open("wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(str(temporary_file), str(filepath))
+        except OSError:
+            pass
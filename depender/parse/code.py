@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import List, Union
 
 from depender.graph.dependency import DependencyGraph
+from depender.parse.utilities import find_python_files
 
 
 class CodeParser:
@@ -34,7 +35,7 @@ class CodeParser:
         else:
             # Traverse the whole directory, up to the given depth, to find all python modules and files
             file_list = self.find_all_package_modules(
-                package_path, excluded_directories, self.graph
+                package_path, excluded_directories, self.graph, follow_links
             )
         # Finally traverse only the files that were found
         for filepath, module_dot_path in file_list:
@@ -47,14 +48,52 @@ class CodeParser:
             )
         return self.graph
 
+    def find_project_files(
+        self,
+        package_path: Union[str, Path],
+        is_module: bool,
+        excluded_directories: List[Union[str, Path]],
+        follow_links: bool = True,
+        **kwargs,
+    ) -> List[Path]:
+        r"""Find the files that parse_project reads when given the same arguments
+
+        Args:
+            package_path: Path to the package or module
+            is_module: Whether the path points to a single module
+            excluded_directories: Directories, relative to the package, to skip
+            follow_links: Whether directories pointed to by symlinks are visited
+            **kwargs: Other arguments of parse_project, which do not change the files
+
+        Returns:
+            Paths of the python files that are parsed
+        """
+        if isinstance(package_path, str):
+            package_path = Path(package_path).resolve()
+        if is_module:
+            return [package_path]
+        excluded_directories = list(
+            map(lambda x: package_path.joinpath(x).resolve(), excluded_directories)
+        )
+        return [
+            file
+            for file in find_python_files(
+                package_path, excluded_directories, followlinks=follow_links
+            )
+            if "__init__.py" not in file.name
+        ]
+
     def find_all_package_modules(
         self,
         package_path: Path,
         excluded_directories: List[Path],
         graph: DependencyGraph,
+        follow_links: bool = True,
     ):
         file_list = list()
-        for file in package_path.rglob("*.py"):
+        for file in find_python_files(
+            package_path, excluded_directories, followlinks=follow_links
+        ):
             # Skip  __init__.py files
             if "__init__.py" in file.name:
                 continue
@@ -72,40 +111,59 @@ class CodeParser:
         include_external: bool,
         parse_importlib: bool,
     ) -> None:
-        with filepath.open("r") as f:
-            module_tree = ast.parse(f.read())
-            for node in ast.walk(module_tree):
-                if isinstance(node, ast.Import):
+        module_tree = self.parse_source(filepath)
+        for node in ast.walk(module_tree):
+            if isinstance(node, ast.Import):
+                self.parse_first_form_import(
+                    import_node=node,
+                    importing_module=module_dot_path,
+                    package_name=package_name,
+                    include_external=include_external,
+                )
+
+            elif isinstance(node, ast.ImportFrom):
+                # In case the import is of the form: from . import foo
+                # Then the module attribute is set to None and so we treat the import
+                # as an import of the first form
+                if node.module is None:
                     self.parse_first_form_import(
                         import_node=node,
                         importing_module=module_dot_path,
                         package_name=package_name,
                         include_external=include_external,
                     )
+                else:
+                    self.parse_second_form_import(
+                        import_node=node,
+                        importing_module=module_dot_path,
+                        package_name=package_name,
+                        include_external=include_external,
+                    )
 
-                elif isinstance(node, ast.ImportFrom):
-                    # In case the import is of the form: from . import foo
-                    # Then the module attribute is set to None and so we treat the import
-                    # as an import of the first form
-                    if node.module is None:
-                        self.parse_first_form_import(
-                            import_node=node,
+            elif isinstance(node, ast.Call) and parse_importlib:
+                if (
+                    isinstance(node.func, ast.Name)
+                    and node.func.id == "import_module"
+                ):
+                    try:
+                        import_node = str(ast.literal_eval(node.args[0]))
+                        package = ""
+                        if node.keywords and node.keywords[0].arg:
+                            package = node.keywords[0].arg
+                        self.parse_importlib_import(
+                            import_node=import_node,
+                            package=package,
                             importing_module=module_dot_path,
-                            package_name=package_name,
                             include_external=include_external,
                         )
-                    else:
-                        self.parse_second_form_import(
-                            import_node=node,
-                            importing_module=module_dot_path,
-                            package_name=package_name,
-                            include_external=include_external,
-                        )
-
-                elif isinstance(node, ast.Call) and parse_importlib:
+                    except ValueError:
+                        pass
+                elif isinstance(node.func, ast.Attribute) and isinstance(
+                    node.func.value, ast.Name
+                ):
                     if (
-                        isinstance(node.func, ast.Name)
-                        and node.func.id == "import_module"
+                        node.func.value.id == "importlib"
+                        and node.func.attr == "import_module"
                     ):
                         try:
                             import_node = str(ast.literal_eval(node.args[0]))
@@ -120,26 +178,21 @@ class CodeParser:
                             )
                         except ValueError:
                             pass
-                    elif isinstance(node.func, ast.Attribute) and isinstance(
-                        node.func.value, ast.Name
-                    ):
-                        if (
-                            node.func.value.id == "importlib"
-                            and node.func.attr == "import_module"
-                        ):
-                            try:
-                                import_node = str(ast.literal_eval(node.args[0]))
-                                package = ""
-                                if node.keywords and node.keywords[0].arg:
-                                    package = node.keywords[0].arg
-                                self.parse_importlib_import(
-                                    import_node=import_node,
-                                    package=package,
-                                    importing_module=module_dot_path,
-                                    include_external=include_external,
-                                )
-                            except ValueError:
-                                pass
+
+    @staticmethod
+    def parse_source(filepath: Path) -> ast.Module:
+        r"""Parse the source code of a python file
+
+        The file is read as bytes so that its encoding declaration is honored.
+
+        Args:
+            filepath: Path to the python file
+
+        Returns:
+            The root node of the file's abstract syntax tree
+        """
+        with filepath.open("rb") as f:
+            return ast.parse(f.read())
 
     def parse_first_form_import(
         self,
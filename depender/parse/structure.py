@@ -29,7 +29,11 @@ class StructureParser:
             if not self.graph.has_node(str(root)):
                 self.graph.add_node(str(root), label=root.name, type="root")
 
-            for i, element in enumerate(dirs + files):
+            # The walk already told directories and files apart,
+            # so there is no need to stat every element again
+            elements = [(element, "directory") for element in dirs]
+            elements += [(element, "file") for element in files]
+            for element, element_type in elements:
                 if "__pycache__" == element.name:
                     continue
                 if ".pyc" == element.suffix:
@@ -37,16 +41,47 @@ class StructureParser:
 
                 # Add the actual node to the graph
                 full_path = root / element
-
-                if full_path.is_file():
-                    self.graph.add_node(
-                        str(full_path), label=full_path.name, type="file"
-                    )
-                else:
-                    self.graph.add_node(
-                        str(full_path), label=full_path.name, type="directory"
-                    )
+                self.graph.add_node(
+                    str(full_path), label=full_path.name, type=element_type
+                )
 
                 # Connect the current root to the current file/directory
                 self.graph.add_edge(str(root), str(full_path))
         return self.graph
+
+    def find_project_files(
+        self,
+        package_path: Union[str, Path],
+        excluded_directories: List[Union[str, Path]],
+        follow_links: bool = True,
+        depth: int = 5,
+        **kwargs,
+    ) -> List[Path]:
+        r"""Find the files and directories that parse_project adds to the graph
+        when given the same arguments
+
+        Args:
+            package_path: Path to the package
+            excluded_directories: Directories, relative to the package, to skip
+            follow_links: Whether directories pointed to by symlinks are visited
+            depth: Depth of the directory recursion
+            **kwargs: Other arguments, which do not change the files
+
+        Returns:
+            Paths of the files and directories in the structure graph
+        """
+        if isinstance(package_path, str):
+            package_path = Path(package_path)
+        excluded_directories = list(
+            map(lambda x: package_path.joinpath(x).resolve(), excluded_directories)
+        )
+        project_files = list()
+        for root, dirs, files in traverse_directory(
+            package_path, excluded_directories, depth=depth, followlinks=follow_links
+        ):
+            project_files.append(root)
+            for element in dirs + files:
+                if "__pycache__" == element.name or ".pyc" == element.suffix:
+                    continue
+                project_files.append(root / element)
+        return project_files
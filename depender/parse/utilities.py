@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Iterable, Iterator, List, Set, Tuple
 
 
 def traverse_directory(
@@ -13,7 +13,11 @@ def traverse_directory(
     root_depth = len(directory.parents)
     dirlist = list()
 
-    for root, dirs, files in os.walk(directory.resolve(), followlinks=followlinks):
+    # os.walk already lists the directories with os.scandir and uses the type of
+    # its entries to tell directories and files apart
+    for root, walk_dirs, files in os.walk(
+        directory.resolve(), followlinks=followlinks
+    ):
         root = Path(root).resolve()
         # Check to see if there are user specified directories that should be skipped
         if check_if_skip_directory(root, excluded_directories):
@@ -21,9 +25,11 @@ def traverse_directory(
         # Don't go deeper than "depth" if it has a non-negative value
         current_depth = len(root.parents) - root_depth
         if current_depth > depth >= 0:
+            # The sub-directories are even deeper, so there is no need to walk them
+            walk_dirs.clear()
             continue
         # Convert the dir and filenames to Path instances
-        dirs = list(map(lambda dir: Path(dir), dirs))
+        dirs = list(map(lambda dir: Path(dir), walk_dirs))
         files = list(map(lambda file: Path(file), files))
         # Remove directories that start with a '.'
         dirs = skip_hidden_directories(dirs)
@@ -35,6 +41,67 @@ def traverse_directory(
         yield root, dirs, files
 
 
+def find_python_files(
+    directory: Path, excluded_directories: List[Path], followlinks: bool
+) -> Iterator[Path]:
+    r"""Recursively find all python files in the given directory.
+
+    Files are yielded before the contents of sub-directories,
+    in the same order as :code:`directory.rglob("*.py")` would.
+    The directory entries returned by :code:`os.scandir` are used directly
+    so that no additional stat call is needed per entry.
+    Each directory is visited at most once, even if symlinks form a cycle,
+    and directories that cannot be read are skipped like :code:`os.walk` does.
+
+    Args:
+        directory: Directory to search
+        excluded_directories: Resolved paths of directories to skip
+        followlinks: Whether to visit directories pointed to by symlinks
+
+    Returns:
+        Iterator over the paths of the python files
+    """
+    visited_directories = {os.path.realpath(str(directory))}
+    yield from _find_python_files(
+        directory, excluded_directories, followlinks, visited_directories
+    )
+
+
+def _find_python_files(
+    directory: Path,
+    excluded_directories: List[Path],
+    followlinks: bool,
+    visited_directories: Set[str],
+) -> Iterator[Path]:
+    files = list()
+    sub_directories = list()
+    try:
+        with os.scandir(str(directory)) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=followlinks):
+                        sub_directories.append(entry.name)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        files.append(directory / entry.name)
+                except OSError:
+                    # e.g. a broken symlink or a symlink pointing to itself
+                    continue
+    except OSError:
+        return
+    yield from files
+    for name in sub_directories:
+        sub_directory = directory / name
+        real_path = os.path.realpath(str(sub_directory))
+        if real_path in visited_directories:
+            continue
+        if check_if_skip_directory(Path(real_path), excluded_directories):
+            continue
+        visited_directories.add(real_path)
+        yield from _find_python_files(
+            sub_directory, excluded_directories, followlinks, visited_directories
+        )
+
+
 def check_if_skip_directory(directory: Path, excluded_directories: List[Path]) -> bool:
     if directory in excluded_directories or "__pycache__" in directory.name:
         return True
@@ -29,6 +29,7 @@ setup(
     author="Anes Benmerzoug",
     author_email="anes.benmerzoug@gmail.com",
     install_requires=install_requires,
+    extras_require={"igraph": ["python-igraph>=0.8.3"]},
     include_package_data=True,
     packages=find_packages(exclude=["tests", "docs"]),
     entry_points={"console_scripts": ["depender=depender.cli:main"]},
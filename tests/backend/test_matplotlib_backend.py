@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import matplotlib
+import pytest
+from depender.graph.dependency import DependencyGraph
+
+matplotlib.use("Agg")
+
+from depender.backend.matplotlib import MatplotlibBackend  # noqa: E402
+
+
+@pytest.fixture
+def graph() -> DependencyGraph:
+    graph = DependencyGraph()
+    graph.add_edge("package.a", "package.b")
+    graph.add_edge("package.a", "package.c")
+    graph.add_edge("package.b", "package.c")
+    return graph
+
+
+def test_dependency_matrix_svg_keeps_vector_labels(
+    graph: DependencyGraph, tmp_path: Path
+) -> None:
+    backend = MatplotlibBackend(output_dir=tmp_path, format=".svg")
+    backend.plot_dependency_matrix(graph)
+    svg = (tmp_path / "dependency_matrix.svg").read_text()
+    # Each module name is a vector tick label on both axes
+    for index in range(1, graph.number_of_nodes() + 1):
+        assert 'id="xtick_{}"'.format(index) in svg
+        assert 'id="ytick_{}"'.format(index) in svg
+    # The matrix itself is the only image
+    assert svg.count("<image") == 1
+
+
+def test_dependency_graph_svg_rasterizes_nodes_and_edges(
+    graph: DependencyGraph, tmp_path: Path
+) -> None:
+    backend = MatplotlibBackend(output_dir=tmp_path, format=".svg")
+    backend.plot_dependency_graph(graph)
+    svg = (tmp_path / "dependency_graph.svg").read_text()
+    assert svg.count("<image") == 1
@@ -0,0 +1,65 @@
+import sys
+
+import numpy as np
+import pytest
+from depender.graph.dependency import DependencyGraph
+
+
+@pytest.fixture
+def non_planar_graph() -> DependencyGraph:
+    # The complete graph on 5 nodes is the smallest non planar graph
+    graph = DependencyGraph()
+    nodes = [str(i) for i in range(5)]
+    for source in nodes:
+        for sink in nodes:
+            if source != sink:
+                graph.add_edge(source, sink)
+    return graph
+
+
+def test_dependency_layout_non_planar_networkx(
+    non_planar_graph: DependencyGraph, monkeypatch
+) -> None:
+    # Make importing igraph fail to force the networkx fallback
+    monkeypatch.setitem(sys.modules, "igraph", None)
+    non_planar_graph.layout(graph=True)
+    positions = np.array(
+        [non_planar_graph.nodes[node]["position"] for node in non_planar_graph]
+    )
+    assert positions.shape == (5, 2)
+    assert np.abs(positions).max() == pytest.approx(1.0)
+
+
+def test_dependency_layout_non_planar_igraph(non_planar_graph: DependencyGraph) -> None:
+    pytest.importorskip("igraph")
+    non_planar_graph.layout(graph=True)
+    positions = np.array(
+        [non_planar_graph.nodes[node]["position"] for node in non_planar_graph]
+    )
+    assert positions.shape == (5, 2)
+    # igraph's coordinates are rescaled to the same range as networkx layouts
+    assert np.abs(positions).max() == pytest.approx(1.0)
+    assert positions.mean(axis=0) == pytest.approx([0.0, 0.0], abs=1e-9)
+
+
+def test_dependency_layout_matrix_is_idempotent() -> None:
+    graph = DependencyGraph()
+    graph.add_edge("a", "b")
+    graph.add_edge("a", "c")
+    graph.layout(matrix=True)
+    graph.layout(matrix=True)
+    assert graph.edges["a", "b"]["count"] == 1
+    assert graph.edges["a", "c"]["count"] == 1
+
+
+def test_dependency_compute_degrees() -> None:
+    graph = DependencyGraph()
+    graph.add_edge("a", "b")
+    graph.add_edge("a", "c")
+    graph.add_edge("b", "c")
+    graph.add_node("d")
+    in_degrees, out_degrees = graph.compute_degrees()
+    assert in_degrees == dict(graph.in_degree())
+    assert out_degrees == dict(graph.out_degree())
+    assert in_degrees == {"a": 0, "b": 1, "c": 2, "d": 0}
+    assert out_degrees == {"a": 2, "b": 1, "c": 0, "d": 0}
@@ -0,0 +1,106 @@
+import pickle
+from pathlib import Path
+
+import pytest
+from depender.cli import parse_project
+from depender.graph.dependency import DependencyGraph
+from depender.parse.cache import ParseCache
+from depender.parse.code import CodeParser
+from depender.parse.structure import StructureParser
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+    package = tmp_path / "package"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "module.py").write_text("import os\nfrom package.sub import other\n")
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "sub" / "other.py").write_text("import sys\n")
+    return package
+
+
+def test_cache_key_changes_with_content(package: Path, tmp_path: Path) -> None:
+    module = package / "module.py"
+    files = [module]
+    cache = ParseCache(tmp_path / "cache")
+    key = cache.compute_key(package, files, depth=1)
+    assert cache.compute_key(package, files, depth=1) == key
+    assert cache.compute_key(package, files, depth=2) != key
+    assert cache.compute_key(package, files, hash_contents=False, depth=1) != key
+    module.write_text("import sys\n")
+    assert cache.compute_key(package, files, depth=1) != key
+
+
+def test_cache_save_and_load(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "cache")
+    graph = DependencyGraph()
+    graph.add_edge("a", "b")
+    assert cache.load(("entry", "digest")) is None
+    cache.save(("entry", "digest"), graph)
+    loaded_graph = cache.load(("entry", "digest"))
+    assert isinstance(loaded_graph, DependencyGraph)
+    assert list(loaded_graph.edges) == [("a", "b")]
+    # The entry was computed from other files
+    assert cache.load(("entry", "other digest")) is None
+
+
+def test_cache_load_outdated_entry(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "cache")
+    cache.cache_dir.mkdir()
+    # Pickle referring to a class that does not exist anymore
+    (cache.cache_dir / "entry.pkl").write_bytes(
+        pickle.dumps(("digest", DependencyGraph())).replace(
+            b"DependencyGraph", b"RemovedGraphs_"
+        )
+    )
+    assert cache.load(("entry", "digest")) is None
+
+
+def test_cache_key_changes_with_depender_version(
+    package: Path, tmp_path: Path, monkeypatch
+) -> None:
+    cache = ParseCache(tmp_path / "cache")
+    files = [package / "module.py"]
+    key = cache.compute_key(package, files)
+    monkeypatch.setattr("depender.parse.cache.get_depender_version", lambda: "0.0.0")
+    assert cache.compute_key(package, files)[0] != key[0]
+
+
+def test_cache_entry_is_overwritten(package: Path, tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "cache")
+    kwargs = dict(
+        package_path=package,
+        is_module=False,
+        excluded_directories=(),
+        include_external=True,
+        follow_links=True,
+    )
+    module = package / "module.py"
+    for i in range(3):
+        module.write_text("import module_{}\n".format(i))
+        graph = parse_project(CodeParser(), cache, **kwargs)
+        assert graph.has_node("module_{}".format(i))
+    # A single entry, along with the digests of its files, is kept
+    assert len(list(cache.cache_dir.iterdir())) == 2
+    assert parse_project(CodeParser(), cache, **kwargs).has_node("module_2")
+
+
+@pytest.mark.parametrize("parser_class", [CodeParser, StructureParser])
+def test_cached_graph_equals_fresh_parse(
+    parser_class, package: Path, tmp_path: Path, monkeypatch
+) -> None:
+    cache = ParseCache(tmp_path / "cache")
+    kwargs = dict(excluded_directories=(), follow_links=True)
+    if parser_class is CodeParser:
+        kwargs.update(is_module=False, include_external=True)
+    # Fill the cache using the absolute path then parse the same package
+    # through a relative path
+    parse_project(parser_class(), cache, package_path=package, **kwargs)
+    monkeypatch.chdir(str(package))
+    cached_graph = parse_project(
+        parser_class(), cache, package_path=Path("."), **kwargs
+    )
+    fresh_graph = parse_project(parser_class(), None, package_path=Path("."), **kwargs)
+    assert list(cached_graph.nodes) == list(fresh_graph.nodes)
+    assert list(cached_graph.edges) == list(fresh_graph.edges)
@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+import pytest
+from depender.parse.utilities import find_python_files, traverse_directory
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+    r"""Create a package with the following structure:
+
+        package
+        ├── a.py
+        ├── notes.txt
+        ├── excluded
+        │   └── c.py
+        └── sub
+            ├── b.py
+            └── loop -> ..
+    """
+    package = tmp_path / "package"
+    (package / "sub").mkdir(parents=True)
+    (package / "excluded").mkdir()
+    (package / "a.py").write_text("")
+    (package / "notes.txt").write_text("")
+    (package / "sub" / "b.py").write_text("")
+    (package / "excluded" / "c.py").write_text("")
+    os.symlink("..", str(package / "sub" / "loop"))
+    return package
+
+
+def test_find_python_files_symlink_cycle(package: Path) -> None:
+    files = list(find_python_files(package, [], followlinks=True))
+    assert sorted(files) == [
+        package / "a.py",
+        package / "excluded" / "c.py",
+        package / "sub" / "b.py",
+    ]
+
+
+def test_find_python_files_excluded_directories(package: Path) -> None:
+    excluded_directories = [(package / "excluded").resolve()]
+    files = list(find_python_files(package, excluded_directories, followlinks=False))
+    assert sorted(files) == [package / "a.py", package / "sub" / "b.py"]
+
+
+def test_traverse_directory_depth(package: Path) -> None:
+    roots = [
+        root
+        for root, _, _ in traverse_directory(package, [], depth=0, followlinks=False)
+    ]
+    assert roots == [package.resolve()]